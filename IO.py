@@ -17,8 +17,15 @@
 
 # Built-In
 from enum import Enum
-import inspect
-from time import localtime, strftime
+import linecache
+import sys
+from time import localtime, strftime, time
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- CONSTANTS --#
+
+# last formatted timestamp, as [epoch second, formatted string]
+_ts_cache = [0, '']
 
 #----------------------------------------------------------------------------------------#
 #------------------------------------------------------------------------------- ENUMS --#
@@ -36,29 +43,31 @@ class Level(Enum):
 
 
 def log(message, level=Level.INFO, step_back=2, width=120):
-    trace = _build_trace(step_back)
+    # only warnings/errors show a stack trace
+    trace = None
+    if level != Level.TRACE and level != Level.INFO:
+        trace = _build_trace(step_back)
 
     _log_to_console(message, level, trace, width)
 
 
 def _log_to_console(message, level, trace, width):
-    time_str = strftime("%H:%M:%S", localtime())
+    # reuse the timestamp if it was already formatted this second
+    # racing threads would only format the same second twice, so there is no lock
+    now = int(time())
+    if now != _ts_cache[0]:
+        _ts_cache[1] = strftime("%H:%M:%S", localtime(now))
+        _ts_cache[0] = now
+    time_str = _ts_cache[1]
 
     # noinspection PyTypeChecker
-    s = f'{time_str}  [{level.value.upper()}]  '
-    indent = ''.join([' ' for _ in s])
-    lines = []
-
-    # wrap lines to fit width
-    for c in message:
-        s += c
-        if c == '\n' or len(s) >= width:
-            lines.append(s)
-            s = indent
+    prefix = f'{time_str}  [{level.value.upper()}]  '
+    indent = ' ' * len(prefix)
+    step = max(width - len(prefix), 1)
 
-    # send to console
-    lines.append(s)
-    print('\n'.join(lines))
+    # send to console, wrapping lines to fit width
+    lines = _wrap_lines(message, step)
+    print(f'{prefix}{next(lines)}', *(f'{indent}{line}' for line in lines), sep='\n')
 
     if level == Level.TRACE or level == Level.INFO:
         return
@@ -68,22 +77,31 @@ def _log_to_console(message, level, trace, width):
         file = frame['file']
         line = frame['line']
         function = frame['function']
-        context = frame['context']
         print(f'  File "{file}", line {line}, in {function}')
+
+        # source is only looked up for frames that are printed
+        context = linecache.getline(file, line).strip()
         if context:
-            print(f'    {context.lstrip()}')
+            print(f'    {context}')
+
+
+def _wrap_lines(message, width):
+    for line in message.split('\n'):
+        if not line:
+            yield ''
+        for i in range(0, len(line), width):
+            yield line[i:i + width]
 
 
 def _build_trace(steps_back=2):
-    stack = iter(inspect.stack())
-    for i in range(steps_back):
-        next(stack)
-
-    return [{
-                'file': frame.filename,
-                'line': frame.lineno,
-                'function': frame.function,
-                'context': frame.code_context[0][:-1] if frame.code_context else None,
-             }
-            for frame in stack
-    ]
+    trace = []
+    frame = sys._getframe(steps_back)
+    while frame:
+        trace.append({
+            'file': frame.f_code.co_filename,
+            'line': frame.f_lineno,
+            'function': frame.f_code.co_name,
+        })
+        frame = frame.f_back
+
+    return trace
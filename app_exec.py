@@ -16,12 +16,18 @@
 #----------------------------------------------------------------------------- IMPORTS --#
 
 # Built-In
+from functools import lru_cache
 import os
 import shutil
+import subprocess
 from subprocess import Popen, DEVNULL
-from threading import Thread
-from time import sleep
-from queue import Queue
+from threading import Lock, Thread
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- CONSTANTS --#
+
+# serializes notify calls made from the per-process wait threads
+_NOTIFY_LOCK = Lock()
 
 #----------------------------------------------------------------------------------------#
 #--------------------------------------------------------------------------- FUNCTIONS --#
@@ -34,18 +40,19 @@ class AppExecuter(object):
     child.run()
     """
     NAME_EXE: str = None
-    PROCESSES: Queue[Popen] = Queue()
-    WATCHER: Thread = None
 
     def __init__(self, name_exe=None, path_exe=None):
         if name_exe:
             self.NAME_EXE = name_exe
         self.path_exe: str = path_exe
+        self._validated: bool = False
 
     @classmethod
+    @lru_cache(maxsize=32)
     def _get_exe_path(cls, name_exe: str) -> str:
         """
-        Gets the absolute path to the exe on path.
+        Gets the absolute path to the exe on path. Results are cached per exe name, so
+        PATH is only searched once.
 
         :param name_exe: name of an exe (does not have to have the extension)
         :type: str
@@ -56,53 +63,39 @@ class AppExecuter(object):
         return shutil.which(name_exe)
 
     @classmethod
-    def _watch_processes(cls, queue: Queue[Popen]):
+    def _await_one(cls, process: Popen):
         """
-        Periodically checks the queue of processes. Notifies the user of the process
-        results, when each one completes. The loop terminates if there are no more
-        processes to check.
+        Blocks until the provided process terminates, then notifies the user of the
+        process results. This is meant to be run on its own thread, one per process.
+        Notifications are serialized, so only one notify call runs at a time.
 
-        :param queue: thread-safe queue of processes to watch
-        :type: Queue[Popen]
+        :param process: subprocess to wait on
+        :type: Popen
         """
-        while True:
-            sleep(0.5)
-
-            # check processes in queue
-            running = []
-            while not queue.empty():
-                process = queue.get()
+        process.wait()
 
-                # ignore processes that are still running
-                process.poll()
-                if process.returncode is None:
-                    running.append(process)
-                    continue
-
-                # notify user of success or failure
-                cls.notify(process)
-
-            # if there are no more subprocesses to manage, shut down the thread
-            if not running:
-                break
-
-            # return processes that are still running
-            for process in running:
-                queue.put(process)
+        # notify user of success or failure
+        with _NOTIFY_LOCK:
+            cls.notify(process)
 
     def validate(self) -> bool:
         """
-        Lazily collects and validates information necessary to run this executer.
+        Lazily collects and validates information necessary to run this executer. Once
+        valid, the result is remembered and later calls return immediately.
 
         :return: True if self is valid
         :type: bool
         """
+        if self._validated:
+            return True
+
         # validate exe path
         if not self.path_exe:
             self.path_exe = self._get_exe_path(self.NAME_EXE)
-            if not os.path.isfile(self.path_exe):
-                return False
+        if not self.path_exe or not os.path.isfile(self.path_exe):
+            return False
 
+        self._validated = True
         return True
 
     def run(self, *args, **kwargs) -> Popen:
@@ -119,21 +112,25 @@ class AppExecuter(object):
             return None
 
         # start subprocess
-        args = list(args)
+        # the exe is passed as argv[0], otherwise the first arg would be consumed as it
+        args = [self.path_exe, *args]
         for kwarg in kwargs:
             args.append(f'-{kwarg}')
             args.append(kwargs[kwarg])
 
-        process = Popen(args, executable=self.path_exe, stdout=DEVNULL)
+        # on windows, don't flash a console window per process
+        kwargs_popen = {'executable': self.path_exe, 'stdout': DEVNULL}
+        if os.name == 'nt':
+            kwargs_popen['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+        process = Popen(args, **kwargs_popen)
         process.executable = self.path_exe
 
-        # lazy create the thread
-        if not self.WATCHER or not self.WATCHER.is_alive():
-            self.WATCHER = Thread(target=self._watch_processes, args=(self.PROCESSES, ))
-            self.WATCHER.start()
+        # wait for the process to complete on a separate thread
+        Thread(
+            target=self._await_one, args=(process, ), name=f'exec-wait:{self.NAME_EXE}'
+        ).start()
 
-        # add process to the queue being watched
-        self.PROCESSES.put(process)
         return process
 
     @classmethod
@@ -147,11 +144,13 @@ class AppExecuter(object):
         """
         # log result
         result, errors = process.communicate()
-        print(f'Finished subprocess: "{process.executable}" {" ".join(process.args)}')
+        args = ' '.join(map(str, process.args[1:]))
+        print(f'Finished subprocess: "{process.executable}" {args}')
         print(f'  {errors}')
 
         # notify user with GUI
-        # be careful, this is called by cls._watch_processes from another thread
+        # be careful, this is called by cls._await_one from a per-process thread, not the
+        # main thread. calls are serialized by a lock, so only one notify runs at a time
         # you can confirm this with threading.current_thread() is threading.main_thread()
         # APIs or GUI libraries you're using may not be thread safe
         # for Maya, you can use evalDefered to run a function on the main thread.
@@ -16,9 +16,10 @@
 #----------------------------------------------------------------------------- IMPORTS --#
 
 # Built-In
+from functools import lru_cache
 import os
 from subprocess import Popen
-from tempfile import NamedTemporaryFile
+from tempfile import mkstemp
 
 # 3rd Party
 try:
@@ -30,6 +31,23 @@ except ImportError:
 # Internal
 from app_exec import AppExecuter
 
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- CONSTANTS --#
+
+# wraps python code run by mayabatch with cleanup code and environment setup
+_WRAPPER_TEMPLATE = (
+    "import utd_menu\n"
+    "try:\n"
+    "    {command}\n"
+    "except Exception as e:\n"
+    "    import traceback\n"
+    "    with open(r'{path_errors}', 'w') as file:\n"
+    "        file.write(traceback.format_exc())\n"
+    "finally:\n"
+    "    import os\n"
+    "    os.remove(r'{path_py}')"
+)
+
 #----------------------------------------------------------------------------------------#
 #----------------------------------------------------------------------------- CLASSES --#
 
@@ -38,6 +56,7 @@ class MayabatchExecuter(AppExecuter):
     NAME_EXE = 'mayabatch.exe'
 
     @classmethod
+    @lru_cache(maxsize=32)
     def _get_exe_path(cls, name_exe: str) -> str:
         path = super()._get_exe_path(name_exe)
 
@@ -76,9 +95,8 @@ class MayabatchExecuter(AppExecuter):
         # make a file to write errors to
         # python errors in mayabatch are sent to stdout, so we need to do some trickery
         # to extract errors from it
-        file_errors = NamedTemporaryFile(delete=False)
-        path_errors = file_errors.name
-        file_errors.close()
+        fd_errors, path_errors = mkstemp()
+        os.close(fd_errors)
 
         # construct command to run the provided function
         if func:
@@ -86,30 +104,21 @@ class MayabatchExecuter(AppExecuter):
 
         # write python command to a temp file for mayabatch to run
         # this will help prevent issues caused by running arbitrary py code in mel
-        file_py = NamedTemporaryFile('w', delete=False)
-        path_py = file_py.name
+        fd_py, path_py = mkstemp()
 
         # inject cleanup code and environment setup
-        command = '\n'.join([
-            f'import utd_menu',
-            f'try:',
-            f'    {command}',
-            f'except Exception as e:',
-            f'    import traceback',
-            f'    with open(r\'{path_errors}\', \'w\') as file:',
-            f'        file.write(traceback.format_exc())',
-            f'finally:',
-            f'    import os',
-            f'    os.remove(r\'{path_py}\')',
-        ])
-
-        # save code
-        file_py.write(command)
-        file_py.close()
+        command = _WRAPPER_TEMPLATE.format(
+            command=command, path_errors=path_errors, path_py=path_py
+        )
+
+        # save code in a single write, mayabatch reads it back as utf-8
+        os.write(fd_py, command.encode('utf-8'))
+        os.close(fd_py)
 
         # run mayabatch!
         path_py = path_py.replace('\\', '\\\\')
-        command = f'python(\"exec(open(r\'{path_py}\', \'r\').read())\")'
+        read_py = f"open(r'{path_py}', 'r', encoding='utf-8').read()"
+        command = f'python(\"exec({read_py})\")'
         if path_maya_file:
             result = super().run(file=path_maya_file, command=command, *args, *kwargs)
         else:
@@ -131,13 +140,18 @@ class MayabatchExecuter(AppExecuter):
 
     @classmethod
     def notify(cls, process: Popen):
-        # check tempfile for any errors
-        with open(process.path_errors, 'r') as file:
-            errors = file.read()
-        os.remove(process.path_errors)
+        # check tempfile for any errors, skipping the read if it is empty
+        try:
+            if os.stat(process.path_errors).st_size == 0:
+                errors = ''
+            else:
+                with open(process.path_errors, 'r') as file:
+                    errors = file.read()
+        finally:
+            os.remove(process.path_errors)
 
         # log result
-        s = 'subprocess: "{process.executable}" {" ".join(process.args)}'
+        s = f'subprocess: "{process.executable}" {" ".join(map(str, process.args[1:]))}'
         if errors:
             print(f'Failed {s}')
             print(errors)
@@ -145,6 +159,7 @@ class MayabatchExecuter(AppExecuter):
             print(f'Finished {s}')
 
         # notify user with GUI
-        # be careful, this is called by cls._watch_processes from another thread
+        # be careful, this is called by cls._await_one from a per-process thread, not the
+        # main thread. calls are serialized by a lock, so only one notify runs at a time
         # you can confirm this with threading.current_thread() is threading.main_thread()
         # you can use evalDefered to run gui on the main thread.
@@ -17,6 +17,7 @@
 
 # Built-In
 from enum import Enum
+from functools import lru_cache
 import os.path
 
 # Third Party
@@ -25,6 +26,14 @@ from PySide2 import QtWidgets, QtCore, QtGui
 # Internal
 from IO import log, Level
 
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- CONSTANTS --#
+
+_RESOURCES_DIR = os.path.join(os.path.dirname(__file__), 'resources')
+
+# loaded pixmaps, keyed by (path, width)
+_pixmap_cache = {}
+
 #----------------------------------------------------------------------------------------#
 #------------------------------------------------------------------------------- ENUMS --#
 
@@ -58,8 +67,27 @@ def set_parent(parent, child, child_super, **kwargs):
         child_super.__init__(parent, **kwargs)
 
 
+def set_widget_parent(parent, child, child_super, **kwargs):
+    # same as set_parent, for children known to be widgets
+    if isinstance(parent, QtWidgets.QLayout):
+        child_super.__init__(**kwargs)
+        parent.addWidget(child)
+    else:
+        child_super.__init__(parent, **kwargs)
+
+
+def set_layout_parent(parent, child, child_super, **kwargs):
+    # same as set_parent, for children known to be layouts
+    if isinstance(parent, QtWidgets.QLayout):
+        child_super.__init__(**kwargs)
+        parent.addLayout(child)
+    else:
+        child_super.__init__(parent, **kwargs)
+
+
+@lru_cache(maxsize=256)
 def get_resource_path(name, resolution='full'):
-    return os.path.join(os.path.dirname(__file__), 'resources', resolution, name)
+    return os.path.join(_RESOURCES_DIR, resolution, name)
 
 
 def get_app():
@@ -223,18 +251,24 @@ class UserConfirm(Dialog):
 
 #region Layouts
 class VLayout(QtWidgets.QVBoxLayout):
+    __slots__ = ()
+
     def __init__(self, parent=None):
-        set_parent(parent, self, super())
+        set_layout_parent(parent, self, super())
 
 
 class HLayout(QtWidgets.QHBoxLayout):
+    __slots__ = ()
+
     def __init__(self, parent=None):
-        set_parent(parent, self, super())
+        set_layout_parent(parent, self, super())
 
 
 class FormLayout(QtWidgets.QFormLayout):
+    __slots__ = ()
+
     def __init__(self, parent=None):
-        set_parent(parent, self, super())
+        set_layout_parent(parent, self, super())
 
     def add_readonly_row(self, label: str, value: str):
         le_value = QtWidgets.QLineEdit()
@@ -246,38 +280,46 @@ class FormLayout(QtWidgets.QFormLayout):
 
 
 class GridLayout(QtWidgets.QGridLayout):
+    __slots__ = ()
+
     def __init__(self, parent=None):
-        set_parent(parent, self, super())
+        set_layout_parent(parent, self, super())
 #endregion
 
 
 #region Widgets
 class Widget(QtWidgets.QWidget):
+    __slots__ = ()
+
     def __init__(self, parent=None):
-        set_parent(parent, self, super())
+        set_widget_parent(parent, self, super())
 
 
 class Button(QtWidgets.QPushButton):
+    __slots__ = ()
+
     def __init__(self, text: str, callback, parent=None, stylesheet=None):
         """
         Creates a button with the provided label that performs the callback on click.
         """
-        set_parent(parent, self, super(), text=text)
+        set_widget_parent(parent, self, super(), text=text)
         self.clicked.connect(callback)
         if stylesheet:
             self.setStyleSheet(stylesheet)
 
 
 class Label(QtWidgets.QLabel):
+    __slots__ = ('pixel_map', 'resolution', 'is_path')
+
     def __init__(self, text, parent=None, stylesheet=None, resolution=None, is_path=None,
                  width=None):
         self.pixel_map = None
         self.resolution = resolution
         self.is_path = is_path
         if not resolution and not is_path:
-            set_parent(parent, self, super(), text=text)
+            set_widget_parent(parent, self, super(), text=text)
         else:
-            set_parent(parent, self, super())
+            set_widget_parent(parent, self, super())
             self.set_image(text, width=width)
         if stylesheet:
             self.setStyleSheet(stylesheet)
@@ -298,16 +340,21 @@ class Label(QtWidgets.QLabel):
             self.setPixmap(self.pixel_map)
             return None
 
-        self.pixel_map = QtGui.QPixmap(path_img)
-        if width:
-            self.pixel_map = self.pixel_map.scaledToWidth(width)
+        # reuse pixmaps that have already been loaded and scaled
+        key = (path_img, width)
+        self.pixel_map = _pixmap_cache.get(key)
+        if self.pixel_map is None:
+            self.pixel_map = QtGui.QPixmap(path_img)
+            if width:
+                self.pixel_map = self.pixel_map.scaledToWidth(width)
+            _pixmap_cache[key] = self.pixel_map
         self.setPixmap(self.pixel_map)
         return True
 
 
 class ComboBox(QtWidgets.QComboBox):
     def __init__(self, values, parent=None):
-        set_parent(parent, self, super())
+        set_widget_parent(parent, self, super())
         self.addItems(values)
 #endregion
 